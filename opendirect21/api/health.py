@@ -1,47 +1,49 @@
 """Health check endpoints."""
 
-from datetime import datetime
-from fastapi import APIRouter, status
-from typing import Dict, Any
+import hashlib
+import time
+from typing import Any, Dict, Optional
+
+import orjson
+from fastapi import APIRouter, Request, Response, status
 
 router = APIRouter(tags=["health"])
 
 
-@router.get("/health", status_code=status.HTTP_200_OK)
-async def health_check() -> Dict[str, Any]:
-    """System health check endpoint.
-    
-    Returns:
-        Health status with service info and timestamp
+def _timestamped_prefix(payload: Dict[str, Any]) -> bytes:
+    """Serialize a constant payload, leaving a trailing ``timestamp`` member open.
+
+    The returned bytes end inside the ``"timestamp"`` string value so a request
+    only has to append the current time and close the object.
     """
-    return {
+    return orjson.dumps(payload)[:-1] + b',"timestamp":"'
+
+
+# Response bodies are constant apart from the timestamp, so they are
+# serialized once at import time instead of on every probe.
+_HEALTH_PREFIX = _timestamped_prefix(
+    {
         "status": "healthy",
         "service": "OpenDirect 2.1 + Adcom v1.0 API",
         "version": "0.1.0",
-        "timestamp": datetime.utcnow().isoformat(),
     }
+)
 
-
-@router.get("/health/deep", status_code=status.HTTP_200_OK)
-async def deep_health_check() -> Dict[str, Any]:
-    """Detailed health check with subsystem status."""
-    return {
+_DEEP_HEALTH_PREFIX = _timestamped_prefix(
+    {
         "status": "healthy",
         "service": "OpenDirect 2.1 + Adcom v1.0 API",
         "version": "0.1.0",
-        "timestamp": datetime.utcnow().isoformat(),
         "subsystems": {
             "api": "operational",
             "storage": "operational",
             "models": "operational",
         },
     }
+)
 
-
-@router.get("/info", status_code=status.HTTP_200_OK)
-async def service_info() -> Dict[str, Any]:
-    """Get service information and available specs."""
-    return {
+_INFO_PREFIX = _timestamped_prefix(
+    {
         "service": "OpenDirect 2.1 + Adcom v1.0 Reference Server",
         "version": "0.1.0",
         "specifications": {
@@ -61,5 +63,83 @@ async def service_info() -> Dict[str, Any]:
             "redoc": "/redoc",
             "openapi": "/openapi.json",
         },
-        "timestamp": datetime.utcnow().isoformat(),
     }
+)
+
+
+def _weak_etag(prefix: bytes) -> str:
+    """Build a weak ETag for a body whose only varying member is the timestamp."""
+    return f'W/"{hashlib.blake2b(prefix, digest_size=8).hexdigest()}"'
+
+
+_HEALTH_ETAG = _weak_etag(_HEALTH_PREFIX)
+_INFO_ETAG = _weak_etag(_INFO_PREFIX)
+
+_HEALTH_CACHE_HEADERS = {"etag": _HEALTH_ETAG, "cache-control": "no-cache"}
+_INFO_CACHE_HEADERS = {"etag": _INFO_ETAG, "cache-control": "public, max-age=60"}
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """Check ``If-None-Match`` against ``etag`` using weak comparison."""
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return False
+    if header.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+# Probes do not need sub-second precision, so the formatted timestamp is
+# reused until the wall clock moves on to the next second.
+_timestamp_second = -1
+_timestamp_iso = b""
+
+
+def _utc_timestamp() -> bytes:
+    """Return the current UTC time as ISO-8601 bytes at one-second granularity."""
+    global _timestamp_second, _timestamp_iso
+
+    now = int(time.time())
+    if now != _timestamp_second:
+        _timestamp_iso = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now)).encode()
+        _timestamp_second = now
+    return _timestamp_iso
+
+
+def _json_with_timestamp(prefix: bytes, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Close a precomputed body with the current timestamp."""
+    body = prefix + _utc_timestamp() + b'"}'
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def health_check(request: Request) -> Response:
+    """System health check endpoint.
+
+    Returns:
+        Health status with service info and timestamp, or 304 Not Modified
+        when ``If-None-Match`` matches the current ETag
+    """
+    if _not_modified(request, _HEALTH_ETAG):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_HEALTH_CACHE_HEADERS)
+    return _json_with_timestamp(_HEALTH_PREFIX, _HEALTH_CACHE_HEADERS)
+
+
+async def deep_health_check(request: Request) -> Response:
+    """Detailed health check with subsystem status."""
+    return _json_with_timestamp(_DEEP_HEALTH_PREFIX)
+
+
+@router.get("/info", status_code=status.HTTP_200_OK)
+async def service_info(request: Request) -> Response:
+    """Get service information and available specs."""
+    if _not_modified(request, _INFO_ETAG):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_INFO_CACHE_HEADERS)
+    return _json_with_timestamp(_INFO_PREFIX, _INFO_CACHE_HEADERS)
+
+
+# Liveness probes are plain Starlette routes: they skip FastAPI's dependency
+# resolution and response model handling and are left out of the schema.
+router.add_route("/health", health_check, methods=["GET"], include_in_schema=False)
+router.add_route("/health/deep", deep_health_check, methods=["GET"], include_in_schema=False)
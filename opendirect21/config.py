@@ -1,43 +1,48 @@
 """Application configuration using Pydantic Settings."""
 
-from typing import List
-from pydantic_settings import BaseSettings
-from functools import lru_cache
+from typing import Optional, Tuple
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment."""
 
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False, frozen=True)
+
     # Server
     server_host: str = "0.0.0.0"
     server_port: int = 8000
     server_reload: bool = True
+    server_workers: int = 1
+    server_access_log: bool = False
     log_level: str = "INFO"
 
     # Database
     database_url: str = "sqlite:///./opendirect21.db"
 
     # CORS
-    cors_origins: List[str] = [
+    cors_origins: Tuple[str, ...] = (
         "http://localhost",
         "http://localhost:3000",
         "http://localhost:8000",
-    ]
+    )
     cors_allow_credentials: bool = True
-    cors_allow_methods: List[str] = ["*"]
-    cors_allow_headers: List[str] = ["*"]
+    cors_allow_methods: Tuple[str, ...] = ("*",)
+    cors_allow_headers: Tuple[str, ...] = ("*",)
 
     # Security
     secret_key: str = "change_me_in_production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+
+_settings: Optional[Settings] = None
 
 
-@lru_cache()
 def get_settings() -> Settings:
     """Get cached settings instance."""
-    return Settings()
+    global _settings
+
+    if _settings is None:
+        _settings = Settings()
+    return _settings
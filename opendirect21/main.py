@@ -4,35 +4,62 @@ Starts the OpenDirect 2.1 + Adcom v1.0 reference server with all routes and conf
 """
 
 import logging
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI, status
+import orjson
+from fastapi import FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from opendirect21.config import get_settings
+from opendirect21.middleware import StaticCORSMiddleware
 from opendirect21.store import InMemoryStore
 from opendirect21.api.health import router as health_router
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 # Global data store (can be replaced with database)
 data_store = InMemoryStore()
 
+# Root metadata never changes, so it is serialized once at import time
+_ROOT_BODY = orjson.dumps(
+    {
+        "service": "OpenDirect 2.1 + Adcom v1.0 Reference Server",
+        "version": "0.1.0",
+        "documentation": "/docs",
+        "specifications": {
+            "opendirect": "2.1 Final",
+            "adcom": "1.0 Final",
+        },
+        "endpoints": {
+            "health": "/health",
+            "health_deep": "/health/deep",
+            "info": "/info",
+            "docs": "/docs",
+            "redoc": "/redoc",
+        },
+    }
+)
+
 
 @asynccontextmanager
-async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
-    """Manage application startup and shutdown."""
+async def logging_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """Configure logging when the server starts rather than at import time."""
+    logging.basicConfig(
+        level=get_settings().log_level.upper(),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    yield
+
+
+@asynccontextmanager
+async def banner_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """Log startup and shutdown banners."""
     # Startup
     logger.info("🚀 Starting OpenDirect 2.1 + Adcom v1.0 Server")
-    logger.info(f"📡 API Documentation: http://localhost:8000/docs")
-    logger.info(f"📚 Alternative Docs: http://localhost:8000/redoc")
+    logger.info("📡 API Documentation: http://localhost:8000/docs")
+    logger.info("📚 Alternative Docs: http://localhost:8000/redoc")
 
     yield
 
@@ -40,6 +67,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("🛑 Shutting down server")
 
 
+# Subsystem lifespans, entered in order on startup and exited in reverse
+# order on shutdown. Add resource managers (DB pools, caches) here.
+LIFESPANS = (logging_lifespan, banner_lifespan)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """Manage application startup and shutdown."""
+    async with AsyncExitStack() as stack:
+        for subsystem_lifespan in LIFESPANS:
+            await stack.enter_async_context(subsystem_lifespan(app))
+        yield
+
+
 def create_app() -> FastAPI:
     """Create and configure FastAPI application."""
     settings = get_settings()
@@ -51,12 +92,15 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
 
-    # Add CORS middleware
+    # Add CORS middleware; explicit origin lists use the precomputed filter,
+    # wildcard origins need Starlette's full middleware
+    cors_middleware = CORSMiddleware if "*" in settings.cors_origins else StaticCORSMiddleware
     app.add_middleware(
-        CORSMiddleware,
+        cors_middleware,
         allow_origins=settings.cors_origins,
         allow_credentials=settings.cors_allow_credentials,
         allow_methods=settings.cors_allow_methods,
@@ -64,45 +108,35 @@ def create_app() -> FastAPI:
     )
 
     # Include routers
-    app.include_router(health_router, tags=["health"])
+    app.include_router(health_router)
 
     # Root endpoint
     @app.get("/", tags=["root"])
-    async def root():
+    async def root() -> Response:
         """API root endpoint with metadata."""
-        return {
-            "service": "OpenDirect 2.1 + Adcom v1.0 Reference Server",
-            "version": "0.1.0",
-            "documentation": "/docs",
-            "specifications": {
-                "opendirect": "2.1 Final",
-                "adcom": "1.0 Final",
-            },
-            "endpoints": {
-                "health": "/health",
-                "health_deep": "/health/deep",
-                "info": "/info",
-                "docs": "/docs",
-                "redoc": "/redoc",
-            },
-        }
+        return Response(content=_ROOT_BODY, media_type="application/json")
 
     # Error handlers
     @app.exception_handler(404)
     async def not_found_handler(request, exc):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"detail": "Endpoint not found", "path": request.url.path},
         )
 
     @app.exception_handler(500)
     async def internal_error_handler(request, exc):
-        logger.error(f"Internal server error: {exc}")
-        return JSONResponse(
+        logger.error("Internal server error: %s", exc)
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={"detail": "Internal server error"},
         )
 
+    # Warm start: build and cache the OpenAPI schema now so the first
+    # /openapi.json or /docs request does not pay for it. Route response
+    # fields and dependants are already built when routes are registered.
+    app.openapi()
+
     return app
 
 
@@ -114,9 +148,11 @@ if __name__ == "__main__":
 
     settings = get_settings()
     uvicorn.run(
-        app,
+        "opendirect21.main:app",
         host=settings.server_host,
         port=settings.server_port,
         reload=settings.server_reload,
+        workers=settings.server_workers,
+        access_log=settings.server_access_log,
         log_level=settings.log_level.lower(),
     )
@@ -0,0 +1,111 @@
+"""ASGI middleware."""
+
+from typing import List, Optional, Sequence, Tuple
+
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class StaticCORSMiddleware:
+    """CORS filter for a fixed list of allowed origins.
+
+    Simple requests are matched on the raw ``origin`` header bytes against a
+    precomputed set and get precomputed response headers, without decoding
+    or building header objects per request. Preflight requests are delegated
+    to Starlette's ``CORSMiddleware`` so method and header negotiation behave
+    exactly as before.
+
+    Wildcard origins are not supported; use ``CORSMiddleware`` for those.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Sequence[str] = (),
+        allow_methods: Sequence[str] = ("GET",),
+        allow_headers: Sequence[str] = (),
+        allow_credentials: bool = False,
+        expose_headers: Sequence[str] = (),
+        max_age: int = 600,
+    ) -> None:
+        """Initialize middleware.
+
+        Args:
+            app: Downstream ASGI application
+            allow_origins: Exact origins allowed to make cross-origin requests
+            allow_methods: Methods allowed in preflight requests
+            allow_headers: Request headers allowed in preflight requests
+            allow_credentials: Whether to allow credentials
+            expose_headers: Response headers exposed to the browser
+            max_age: Preflight cache lifetime in seconds
+        """
+        if "*" in allow_origins:
+            raise ValueError("StaticCORSMiddleware requires explicit origins")
+
+        self.app = app
+        self.allowed_origins = frozenset(origin.encode("latin-1") for origin in allow_origins)
+        self.preflight = CORSMiddleware(
+            app,
+            allow_origins=allow_origins,
+            allow_methods=allow_methods,
+            allow_headers=allow_headers,
+            allow_credentials=allow_credentials,
+            expose_headers=expose_headers,
+            max_age=max_age,
+        )
+
+        simple_headers: List[Tuple[bytes, bytes]] = []
+        if allow_credentials:
+            simple_headers.append((b"access-control-allow-credentials", b"true"))
+        if expose_headers:
+            simple_headers.append(
+                (b"access-control-expose-headers", ", ".join(expose_headers).encode("latin-1"))
+            )
+        self.simple_headers = tuple(simple_headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin: Optional[bytes] = None
+        requests_method = False
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                if origin is None:
+                    origin = value
+            elif name == b"access-control-request-method":
+                requests_method = True
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if requests_method and scope["method"] == "OPTIONS":
+            await self.preflight(scope, receive, send)
+            return
+
+        allowed = origin in self.allowed_origins
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = self._cors_headers(message, origin if allowed else None)
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    def _cors_headers(self, message: Message, origin: Optional[bytes]) -> List[Tuple[bytes, bytes]]:
+        """Return response headers extended with the CORS headers."""
+        headers = list(message.get("headers", ()))
+        headers.extend(self.simple_headers)
+
+        if origin is not None:
+            headers.append((b"access-control-allow-origin", origin))
+            for i, (name, value) in enumerate(headers):
+                if name == b"vary":
+                    headers[i] = (name, value + b", Origin")
+                    break
+            else:
+                headers.append((b"vary", b"Origin"))
+
+        return headers
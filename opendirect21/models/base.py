@@ -1,9 +1,20 @@
 """Base model classes and utilities."""
 
+import os
 from datetime import datetime
 from typing import Optional, Any, Dict
 from pydantic import BaseModel, Field, ConfigDict
-from uuid import uuid4
+
+
+def new_id() -> str:
+    """Generate a random RFC 4122 version 4 UUID string.
+
+    Formats 16 random bytes directly instead of going through ``uuid.UUID``,
+    which validates and converts its input on every call.
+    """
+    h = os.urandom(16).hex()
+    variant = "89ab"[int(h[16], 16) & 0x3]
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{variant}{h[17:20]}-{h[20:]}"
 
 
 class TimestampedModel(BaseModel):
@@ -20,7 +31,7 @@ class IDModel(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
-    id: str = Field(default_factory=lambda: str(uuid4()), description="Unique identifier (UUID)")
+    id: str = Field(default_factory=new_id, description="Unique identifier (UUID)")
 
 
 class BaseEntity(IDModel, TimestampedModel):
@@ -3,24 +3,22 @@
 For production, replace with PostgreSQL or other database.
 """
 
-import uuid
+import time
+from array import array
 from typing import Any, Dict, List, Optional
-from dataclasses import dataclass, field
-from datetime import datetime
 
-
-@dataclass
-class Entity:
-    """Base entity with metadata."""
-
-    data: Dict[str, Any]
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+from opendirect21.models.base import new_id
 
 
 class InMemoryStore:
     """Thread-safe in-memory data store.
 
+    Each entity type is stored column-wise: the entity dicts, their ids and
+    their created/updated epoch timestamps live in parallel sequences, and an
+    id -> row index gives O(1) lookups. Pagination is a plain list slice.
+    Deleting moves the last row into the freed slot, so listing order is
+    insertion order only until the first delete.
+
     Usage:
         store = InMemoryStore()
         user = await store.create('users', {'name': 'John'})
@@ -31,74 +29,141 @@ class InMemoryStore:
 
     def __init__(self):
         """Initialize empty store."""
-        self.data: Dict[str, Dict[str, Entity]] = {}
+        self.rows: Dict[str, List[Dict[str, Any]]] = {}
+        self.ids: Dict[str, List[str]] = {}
+        self.ctime: Dict[str, array] = {}
+        self.mtime: Dict[str, array] = {}
+        self.idx: Dict[str, Dict[str, int]] = {}
 
     async def list(
         self, entity_type: str, skip: int = 0, limit: int = 100
     ) -> List[Dict[str, Any]]:
         """List all entities of a type with pagination."""
-        if entity_type not in self.data:
+        rows = self.rows.get(entity_type)
+        if rows is None:
             return []
 
-        items = list(self.data[entity_type].values())
-        return [e.data for e in items[skip : skip + limit]]
+        return rows[skip : skip + limit]
 
     async def get(self, entity_type: str, entity_id: str) -> Optional[Dict[str, Any]]:
         """Get specific entity by ID."""
-        if entity_type not in self.data or entity_id not in self.data[entity_type]:
+        index = self.idx.get(entity_type)
+        if index is None:
             return None
 
-        return self.data[entity_type][entity_id].data
+        row = index.get(entity_id)
+        if row is None:
+            return None
+
+        return self.rows[entity_type][row]
 
     async def create(
         self, entity_type: str, entity_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Create new entity with generated UUID."""
-        entity_id = entity_data.get("id") or str(uuid.uuid4())
+        entity_id = entity_data.get("id") or new_id()
         entity_data["id"] = entity_id
 
-        if entity_type not in self.data:
-            self.data[entity_type] = {}
-
-        entity = Entity(data=entity_data)
-        self.data[entity_type][entity_id] = entity
-
-        return entity.data
+        index = self.idx.get(entity_type)
+        if index is None:
+            index = self.idx[entity_type] = {}
+            self.rows[entity_type] = []
+            self.ids[entity_type] = []
+            self.ctime[entity_type] = array("d")
+            self.mtime[entity_type] = array("d")
+
+        now = time.time()
+        row = index.get(entity_id)
+
+        if row is not None:
+            # Creating an existing ID replaces that entity in place
+            self.rows[entity_type][row] = entity_data
+            self.ctime[entity_type][row] = now
+            self.mtime[entity_type][row] = now
+        else:
+            index[entity_id] = len(self.rows[entity_type])
+            self.rows[entity_type].append(entity_data)
+            self.ids[entity_type].append(entity_id)
+            self.ctime[entity_type].append(now)
+            self.mtime[entity_type].append(now)
+
+        return entity_data
 
     async def update(
         self, entity_type: str, entity_id: str, updates: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
         """Update existing entity (merge updates)."""
-        if entity_type not in self.data or entity_id not in self.data[entity_type]:
+        index = self.idx.get(entity_type)
+        if index is None:
+            return None
+
+        row = index.get(entity_id)
+        if row is None:
             return None
 
-        entity = self.data[entity_type][entity_id]
-        entity.data.update(updates)
-        entity.updated_at = datetime.utcnow()
+        entity_data = self.rows[entity_type][row]
+        entity_data.update(updates)
+        self.mtime[entity_type][row] = time.time()
 
-        return entity.data
+        return entity_data
 
     async def delete(self, entity_type: str, entity_id: str) -> bool:
         """Delete entity by ID."""
-        if entity_type not in self.data or entity_id not in self.data[entity_type]:
+        index = self.idx.get(entity_type)
+        if index is None:
             return False
 
-        del self.data[entity_type][entity_id]
+        row = index.pop(entity_id, None)
+        if row is None:
+            return False
+
+        rows = self.rows[entity_type]
+        ids = self.ids[entity_type]
+        ctime = self.ctime[entity_type]
+        mtime = self.mtime[entity_type]
+
+        last = len(rows) - 1
+        if row != last:
+            # Fill the hole with the last row so the columns stay dense
+            rows[row] = rows[last]
+            ids[row] = ids[last]
+            ctime[row] = ctime[last]
+            mtime[row] = mtime[last]
+            index[ids[row]] = row
+
+        rows.pop()
+        ids.pop()
+        ctime.pop()
+        mtime.pop()
         return True
 
     async def delete_all(self, entity_type: str) -> int:
         """Delete all entities of a type."""
-        if entity_type not in self.data:
+        rows = self.rows.get(entity_type)
+        if rows is None:
             return 0
 
-        count = len(self.data[entity_type])
-        self.data[entity_type] = {}
+        count = len(rows)
+        self.rows[entity_type] = []
+        self.ids[entity_type] = []
+        self.ctime[entity_type] = array("d")
+        self.mtime[entity_type] = array("d")
+        self.idx[entity_type] = {}
         return count
 
+    def clear(self) -> None:
+        """Delete all entities of every type."""
+        self.rows.clear()
+        self.ids.clear()
+        self.ctime.clear()
+        self.mtime.clear()
+        self.idx.clear()
+
     async def count(self, entity_type: str) -> int:
         """Count entities of a type."""
-        return len(self.data.get(entity_type, {}))
+        return len(self.rows.get(entity_type, ()))
 
     async def exists(self, entity_type: str, entity_id: str) -> bool:
         """Check if entity exists."""
-        return entity_type in self.data and entity_id in self.data[entity_type]
+        index = self.idx.get(entity_type)
+        return index is not None and entity_id in index
@@ -1,17 +1,30 @@
 """Pytest configuration and fixtures."""
 
+from typing import Iterator
+
 import pytest
-from httpx import AsyncClient
+from fastapi.testclient import TestClient
 
-from opendirect21.main import app
+from opendirect21.main import app, data_store
 from opendirect21.store import InMemoryStore
 
 
-@pytest.fixture
-async def client() -> AsyncClient:
-    """Create test client."""
-    async with AsyncClient(app=app, base_url="http://test") as ac:
-        yield ac
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    """Create test client shared by the whole session.
+
+    Entering the client once keeps a single event loop portal and runs the
+    app lifespan, instead of starting a portal per request.
+    """
+    with TestClient(app) as tc:
+        yield tc
+
+
+@pytest.fixture(autouse=True)
+def reset_data_store() -> Iterator[None]:
+    """Start each test with an empty application data store."""
+    data_store.clear()
+    yield
 
 
 @pytest.fixture
@@ -0,0 +1,42 @@
+"""Tests for CORS handling."""
+
+from fastapi.testclient import TestClient
+
+
+def test_cors_allowed_origin(client: TestClient):
+    """Test allowed origin is mirrored back on simple requests."""
+    response = client.get("/health", headers={"Origin": "http://localhost:3000"})
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert response.headers["vary"] == "Origin"
+
+
+def test_cors_disallowed_origin(client: TestClient):
+    """Test disallowed origin gets no allow-origin header."""
+    response = client.get("/health", headers={"Origin": "http://evil.example"})
+    assert response.status_code == 200
+    assert "access-control-allow-origin" not in response.headers
+
+
+def test_cors_without_origin(client: TestClient):
+    """Test same-origin requests are passed through untouched."""
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert "access-control-allow-origin" not in response.headers
+    assert "access-control-allow-credentials" not in response.headers
+
+
+def test_cors_preflight(client: TestClient):
+    """Test preflight request for an allowed origin."""
+    response = client.options(
+        "/health",
+        headers={
+            "Origin": "http://localhost:3000",
+            "Access-Control-Request-Method": "GET",
+            "Access-Control-Request-Headers": "X-Custom",
+        },
+    )
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+    assert response.headers["access-control-allow-headers"] == "X-Custom"
@@ -1,13 +1,11 @@
 """Tests for health check endpoints."""
 
-import pytest
-from httpx import AsyncClient
+from fastapi.testclient import TestClient
 
 
-@pytest.mark.asyncio
-async def test_health_check(client: AsyncClient):
+def test_health_check(client: TestClient):
     """Test basic health check endpoint."""
-    response = await client.get("/health")
+    response = client.get("/health")
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
@@ -16,10 +14,9 @@ async def test_health_check(client: AsyncClient):
     assert "timestamp" in data
 
 
-@pytest.mark.asyncio
-async def test_deep_health_check(client: AsyncClient):
+def test_deep_health_check(client: TestClient):
     """Test deep health check endpoint."""
-    response = await client.get("/health/deep")
+    response = client.get("/health/deep")
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
@@ -29,10 +26,9 @@ async def test_deep_health_check(client: AsyncClient):
     assert data["subsystems"]["models"] == "operational"
 
 
-@pytest.mark.asyncio
-async def test_service_info(client: AsyncClient):
+def test_service_info(client: TestClient):
     """Test service info endpoint."""
-    response = await client.get("/info")
+    response = client.get("/info")
     assert response.status_code == 200
     data = response.json()
     assert "specifications" in data
@@ -42,10 +38,9 @@ async def test_service_info(client: AsyncClient):
     assert data["specifications"]["adcom"]["version"] == "1.0"
 
 
-@pytest.mark.asyncio
-async def test_root_endpoint(client: AsyncClient):
+def test_root_endpoint(client: TestClient):
     """Test root endpoint."""
-    response = await client.get("/")
+    response = client.get("/")
     assert response.status_code == 200
     data = response.json()
     assert "service" in data
@@ -53,3 +48,23 @@ async def test_root_endpoint(client: AsyncClient):
     assert "documentation" in data
     assert "specifications" in data
     assert "endpoints" in data
+
+
+def test_service_info_etag(client: TestClient):
+    """Test service info revalidation with If-None-Match."""
+    response = client.get("/info")
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "public, max-age=60"
+
+    cached = client.get("/info", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+
+def test_health_check_etag_mismatch(client: TestClient):
+    """Test stale ETag still returns the full health body."""
+    response = client.get("/health", headers={"If-None-Match": 'W/"stale"'})
+    assert response.status_code == 200
+    assert response.json()["status"] == "healthy"
+    assert response.headers["etag"].startswith('W/"')
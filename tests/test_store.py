@@ -1,5 +1,7 @@
 """Tests for data store."""
 
+import uuid
+
 import pytest
 from opendirect21.store import InMemoryStore
 
@@ -15,6 +17,17 @@ async def test_create_entity(store: InMemoryStore):
     assert result["type"] == "Publisher"
 
 
+@pytest.mark.asyncio
+async def test_create_generates_uuid4(store: InMemoryStore):
+    """Test generated IDs are canonical version 4 UUIDs."""
+    result = await store.create("organizations", {"name": "Test"})
+
+    parsed = uuid.UUID(result["id"])
+    assert parsed.version == 4
+    assert parsed.variant == uuid.RFC_4122
+    assert str(parsed) == result["id"]
+
+
 @pytest.mark.asyncio
 async def test_get_entity(store: InMemoryStore):
     """Test getting entity by ID."""
@@ -66,6 +79,21 @@ async def test_delete_entity(store: InMemoryStore):
     assert retrieved is None
 
 
+@pytest.mark.asyncio
+async def test_delete_keeps_other_entities(store: InMemoryStore):
+    """Test deleting from the middle leaves remaining entities reachable."""
+    ids = [(await store.create("organizations", {"name": f"Org {i}"}))["id"] for i in range(3)]
+
+    assert await store.delete("organizations", ids[0]) is True
+
+    assert await store.get("organizations", ids[0]) is None
+    for entity_id in ids[1:]:
+        retrieved = await store.get("organizations", entity_id)
+        assert retrieved is not None
+        assert retrieved["id"] == entity_id
+    assert await store.count("organizations") == 2
+
+
 @pytest.mark.asyncio
 async def test_pagination(store: InMemoryStore):
     """Test pagination in list."""
@@ -102,3 +130,16 @@ async def test_exists_entity(store: InMemoryStore):
 
     not_exists = await store.exists("organizations", "non-existent-id")
     assert not_exists is False
+
+
+@pytest.mark.asyncio
+async def test_clear(store: InMemoryStore):
+    """Test clearing removes entities of every type."""
+    created = await store.create("organizations", {"name": "Org"})
+    await store.create("accounts", {"name": "Account"})
+
+    store.clear()
+
+    assert await store.count("organizations") == 0
+    assert await store.count("accounts") == 0
+    assert await store.get("organizations", created["id"]) is None
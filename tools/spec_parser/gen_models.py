@@ -1,61 +1,89 @@
 """Pydantic model generator from specification objects."""
 
-import re
+import io
+import json
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple
-from dataclasses import dataclass
+
+# Spec primitive type names to Python types, in substring-match priority order
+_PRIMITIVE_TYPES = {
+    "string": "str",
+    "integer": "int",
+    "int": "int",
+    "number": "float",
+    "float": "float",
+    "double": "float",
+    "boolean": "bool",
+    "bool": "bool",
+    "datetime": "datetime",
+    "date-time": "datetime",
+    "date": "date",
+    "uuid": "str",
+}
+
+# Imports every generated model needs; "from datetime" sorts ahead of them
+_BASE_IMPORTS = "from pydantic import BaseModel, Field\nfrom typing import Optional, List\n"
+
+# Generated class header and field line; field lines carry their leading newline
+_CLASS_TEMPLATE = '\n\nclass {name}(BaseModel):\n    """Object definition from specification."""\n'
+_FIELD_TEMPLATE = "\n    {name}: {type} = Field({default}, description={desc})"
+
+
+def _map_primitive(spec_lower: str) -> str:
+    """Map a lowercased primitive spec type to a Python type, defaulting to str.
+
+    Exact names hit the dict directly; decorated names like "string (36)"
+    fall back to a substring scan.
+    """
+    py_type = _PRIMITIVE_TYPES.get(spec_lower)
+    if py_type is not None:
+        return py_type
+
+    for key, value in _PRIMITIVE_TYPES.items():
+        if key in spec_lower:
+            return value
+
+    return "str"
 
 
-@dataclass
 class TypeMapping:
     """Maps specification types to Python types."""
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def map_type(spec_type: str) -> Tuple[str, bool, bool]:
         """Map spec type to Python type.
 
+        Results are memoized, since specs reuse a small set of type strings
+        across many fields.
+
         Returns:
             (python_type, is_optional, is_enum)
         """
-        spec_type = spec_type.strip()
+        # Keyword checks are case-insensitive, so lowercase once up front
+        spec_lower = spec_type.strip().lower()
 
         # Handle optional
-        is_optional = "optional" in spec_type.lower()
-        spec_type = spec_type.replace("optional", "").strip()
+        is_optional = "optional" in spec_lower
+        if is_optional:
+            spec_lower = spec_lower.replace("optional", "").strip()
 
         # Handle enum
-        is_enum = spec_type.startswith("enum")
+        is_enum = spec_lower.startswith("enum")
         if is_enum:
             return "str", is_optional, True
 
         # Handle arrays
-        if spec_type.endswith("[]") or "array" in spec_type.lower():
-            base_type = spec_type.replace("[]", "").replace("array", "").strip()
-            inner_type, inner_opt, inner_enum = TypeMapping.map_type(base_type)
+        if spec_lower.endswith("[]") or "array" in spec_lower:
+            # Optional markers and array suffixes are already stripped, so the
+            # element type resolves directly instead of recursing
+            base_type = spec_lower.replace("[]", "").replace("array", "").strip()
+            inner_type = "str" if base_type.startswith("enum") else _map_primitive(base_type)
             return f"List[{inner_type}]", is_optional, False
 
-        # Primitive types
-        type_map = {
-            "string": "str",
-            "integer": "int",
-            "int": "int",
-            "number": "float",
-            "float": "float",
-            "double": "float",
-            "boolean": "bool",
-            "bool": "bool",
-            "datetime": "datetime",
-            "date-time": "datetime",
-            "date": "date",
-            "uuid": "str",
-        }
-
-        for key, value in type_map.items():
-            if key in spec_type.lower():
-                return value, is_optional, False
-
-        # Default to str for unknown types
-        return "str", is_optional, False
+        # Primitive types; unknown types default to str
+        return _map_primitive(spec_lower), is_optional, False
 
 
 class PydanticGenerator:
@@ -80,38 +108,34 @@ class PydanticGenerator:
         Returns:
             Generated Python code
         """
-        lines = []
-
-        # Imports
-        imports = set()
-        imports.add("from pydantic import BaseModel, Field")
-        imports.add("from typing import Optional, List")
-
-        has_datetime = False
-        for field in fields:
-            py_type, _, _ = TypeMapping.map_type(field.get("type", "str"))
-            if "datetime" in py_type:
-                has_datetime = True
+        buf = io.StringIO()
+        write = buf.write
 
-        if has_datetime:
-            imports.add("from datetime import datetime")
+        # Map each field type once; the import scan and the field lines share it
+        mapped_types = [TypeMapping.map_type(field.get("type", "str")) for field in fields]
 
-        for imp in sorted(imports):
-            lines.append(imp)
+        # Imports
+        if any("datetime" in py_type for py_type, _, _ in mapped_types):
+            write("from datetime import datetime\n")
+        write(_BASE_IMPORTS)
 
-        lines.append("")
-        lines.append("")
-        lines.append(f"class {name}(BaseModel):")
-        lines.append(f'    """Object definition from specification."""')
-        lines.append("")
+        write(_CLASS_TEMPLATE.format(name=name))
 
+        # Each body line starts with its own newline, leaving one blank line
+        # after the docstring and no trailing newline
         if not fields:
-            lines.append("    pass")
+            write("\n    pass")
         else:
-            for field in fields:
+            for field, (py_type, is_opt, is_enum) in zip(fields, mapped_types):
                 name_str = field.get("attribute", "field")
                 desc = field.get("description", "")
-                py_type, is_opt, is_enum = TypeMapping.map_type(field.get("type", "str"))
+
+                # Only quotes, backslashes and control characters need escaping;
+                # a JSON string literal is also a valid Python string literal
+                if '"' in desc or "\\" in desc or not desc.isprintable():
+                    desc = json.dumps(desc, ensure_ascii=False)
+                else:
+                    desc = f'"{desc}"'
                 required = field.get("required", False)
 
                 if is_opt and not required:
@@ -121,11 +145,13 @@ class PydanticGenerator:
                     full_type = py_type
                     default = "..."
 
-                lines.append(
-                    f'    {name_str}: {full_type} = Field({default}, description="{desc}")'
+                write(
+                    _FIELD_TEMPLATE.format(
+                        name=name_str, type=full_type, default=default, desc=desc
+                    )
                 )
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
 
 if __name__ == "__main__":
@@ -1,11 +1,23 @@
 """Markdown table parser for extracting object definitions from specifications."""
 
 import re
-from dataclasses import dataclass
-from typing import List, Iterator, Tuple, Optional
+from dataclasses import dataclass, field
+from typing import Dict, KeysView, List, Iterator, Tuple, Optional
 
+# Parenthesized enum value list, e.g. "enum (Active, Inactive)"
+_PAREN_RE = re.compile(r"\((.*?)\)")
 
-@dataclass
+# One comma-separated enum value with surrounding whitespace excluded
+_ENUM_ITEM_RE = re.compile(r"[^,\s][^,]*(?<!\s)")
+
+# First three cells of a table row "|a|b|c|", each trimmed of spaces and tabs
+_ROW_RE = re.compile(
+    r"^\|[ \t]*([^|\n]*?)[ \t]*\|[ \t]*([^|\n]*?)[ \t]*\|[ \t]*([^|\n]*?)[ \t]*\|",
+    re.MULTILINE,
+)
+
+
+@dataclass(slots=True)
 class FieldDef:
     """Field definition from specification table."""
 
@@ -19,7 +31,7 @@ class FieldDef:
         return f"FieldDef({self.attribute}{req_mark}: {self.type_raw})"
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectDef:
     """Object definition from specification."""
 
@@ -27,6 +39,16 @@ class ObjectDef:
     fields: List[FieldDef]
     section: Optional[str] = None
     description: Optional[str] = None
+    fields_by_name: Dict[str, FieldDef] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Index fields once so lookups by attribute name are O(1)
+        self.fields_by_name = {f.attribute: f for f in self.fields}
+
+    @property
+    def field_names(self) -> KeysView[str]:
+        """Set-like view of field attribute names with O(1) membership."""
+        return self.fields_by_name.keys()
 
     def __repr__(self) -> str:
         return f"ObjectDef({self.name}, {len(self.fields)} fields)"
@@ -41,7 +63,7 @@ class MarkdownTableParser:
 
     # Regex to find table with attributes
     TABLE_RE = re.compile(
-        r"\|Attribute\|Description\|Type\|\n\|--\|--\|--\|\n(?P<body>.*?)(?=\n\n|^##)",
+        r"\|Attribute\|Description\|Type\|\n\|--\|--\|--\|\n(?P<body>.*?)(?=\n\n|^##|\Z)",
         re.MULTILINE | re.DOTALL,
     )
 
@@ -65,22 +87,12 @@ class MarkdownTableParser:
         """
         fields: List[FieldDef] = []
 
-        for line in body.split("\n"):
-            line = line.strip()
-            if not line or line.startswith("|"):
-                continue
+        for attr, desc, typ in _ROW_RE.findall(body):
+            desc = desc.strip("*")
+            typ = typ.strip("*")
 
-            # Split by | and filter empty parts
-            parts = [p.strip(" *") for p in line.split("|")]
-            if len(parts) < 4:
-                continue
-
-            try:
-                attr, desc, typ = parts[1], parts[2], parts[3]
-            except IndexError:
-                continue
-
-            if not attr or not typ:
+            # Skip separator rows like |--|--|--|
+            if not attr.strip("- ") or not typ:
                 continue
 
             # Check if required (marked with *)
@@ -106,12 +118,14 @@ class MarkdownTableParser:
         """
         objects = []
 
-        # Try primary pattern (## Object: Name)
-        for obj_match in self.OBJECT_RE.finditer(self.content):
+        # Try primary pattern (## Object: Name); each object's table must
+        # appear before the next object heading
+        obj_matches = list(self.OBJECT_RE.finditer(self.content))
+        ends = [m.start() for m in obj_matches[1:]] + [len(self.content)]
+
+        for obj_match, end in zip(obj_matches, ends):
             name = obj_match.group("name")
-            start = obj_match.end()
-            chunk = self.content[start:]
-            table_match = self.TABLE_RE.search(chunk)
+            table_match = self.TABLE_RE.search(self.content, obj_match.end(), end)
 
             if not table_match:
                 continue
@@ -134,14 +148,13 @@ class MarkdownTableParser:
             List of (key, value) tuples
         """
         # Try parentheses format: enum (A, B, C)
-        match = re.search(r"\((.*?)\)", text)
+        match = _PAREN_RE.search(text)
         if match:
-            values = [v.strip() for v in match.group(1).split(",")]
-            return [(v.upper().replace(" ", "_"), v) for v in values]
-
-        # Try plain comma-separated
-        values = [v.strip() for v in text.split(",")]
-        if len(values) > 1:
-            return [(v.upper().replace(" ", "_"), v) for v in values]
-
-        return []
+            values = _ENUM_ITEM_RE.findall(text, match.start(1), match.end(1))
+        else:
+            # Try plain comma-separated
+            values = _ENUM_ITEM_RE.findall(text)
+            if len(values) < 2:
+                return []
+
+        return [(v.upper().replace(" ", "_"), v) for v in values]
@@ -1,6 +1,8 @@
 """Smoke tests for parser verification."""
 
+import tempfile
 from pathlib import Path
+from tools.spec_parser.gen_models import PydanticGenerator
 from tools.spec_parser.md_tables import MarkdownTableParser
 
 
@@ -36,13 +38,13 @@ def test_markdown_parser():
     assert len(org.fields) >= 4, f"Expected at least 4 fields in Organization"
 
     # Check field names
-    field_names = [f.attribute for f in org.fields]
+    field_names = org.field_names
     assert "id" in field_names
     assert "name" in field_names
     assert "type" in field_names
 
     # Check required marking
-    id_field = next(f for f in org.fields if f.attribute == "id")
+    id_field = org.fields_by_name["id"]
     assert id_field.required, "id field should be required"
 
     print("✅ Markdown parser test passed")
@@ -51,6 +53,67 @@ def test_markdown_parser():
         print(f"  - {obj.name}: {len(obj.fields)} fields")
 
 
+def test_object_without_table():
+    """Test an object without a table does not take the next object's table."""
+    test_md = """
+## Object: Placeholder
+
+Described elsewhere.
+
+## Object: Account
+
+|Attribute|Description|Type|
+|--|--|--|
+|id*|Account ID|string (36)|
+|status|Account status|enum (Active, Inactive)|"""
+
+    objects = MarkdownTableParser(test_md).extract_objects()
+
+    assert [o.name for o in objects] == ["Account"], "Placeholder should be skipped"
+    assert list(objects[0].field_names) == ["id", "status"]
+
+    print("✅ Object without table test passed")
+
+
+def test_get_enum_values():
+    """Test enum value extraction."""
+    parser = MarkdownTableParser("")
+
+    assert parser.get_enum_values("enum (Active, Not Started)") == [
+        ("ACTIVE", "Active"),
+        ("NOT_STARTED", "Not Started"),
+    ]
+    assert parser.get_enum_values("enum ()") == []
+    assert parser.get_enum_values("Active") == []
+    assert parser.get_enum_values("Active,, Paused") == [
+        ("ACTIVE", "Active"),
+        ("PAUSED", "Paused"),
+    ]
+
+    print("✅ Enum values test passed")
+
+
+def test_generated_code_compiles():
+    """Test generated models keep descriptions as valid string literals."""
+    descriptions = ['The "primary" ID', "Windows path C:\\", "Line one\nline two"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generator = PydanticGenerator(Path(tmp))
+
+        for desc in descriptions:
+            code = generator.generate_model_code(
+                "Sample", [{"attribute": "id", "type": "string", "description": desc}]
+            )
+            namespace: dict = {}
+            exec(compile(code, "<gen>", "exec"), namespace)
+            assert namespace["Sample"].model_fields["id"].description == desc
+
+    print("✅ Generated code test passed")
+
+
 if __name__ == "__main__":
     test_markdown_parser()
+    test_object_without_table()
+    test_get_enum_values()
+    test_generated_code_compiles()
     print("\n✅ All smoke tests passed!")